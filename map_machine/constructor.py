@@ -160,7 +160,6 @@ class Constructor:
         configuration: MapConfiguration,
     ) -> None:
         self.osm_data: OSMData = osm_data
-        self.flinger: Flinger = flinger
         self.scheme: Scheme = configuration.scheme
         self.extractor: ShapeExtractor = extractor
         self.configuration: MapConfiguration = configuration
@@ -177,6 +176,20 @@ class Constructor:
                 x, float(self.configuration.level)
             )
 
+        self.reset(flinger)
+
+    def reset(self, flinger: Flinger) -> None:
+        """
+        Prepare the constructor for another projection.
+
+        Rebind the flinger and clear the per-map accumulators while keeping
+        the scheme, extractor, and label wiring, so that adjacent tiles
+        sharing the same data do not pay the setup cost again.
+
+        :param flinger: converter for geo coordinates
+        """
+        self.flinger: Flinger = flinger
+
         self.points: list[Point] = []
         self.figures: list[StyledFigure] = []
         self.buildings: list[Building] = []
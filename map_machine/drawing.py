@@ -1,7 +1,8 @@
 """Drawing utility."""
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Union
+from typing import IO, Optional, Union
+from xml.etree import ElementTree
 
 import cairo
 import numpy as np
@@ -21,6 +22,38 @@ PathCommands = list[Union[float, str, np.ndarray]]
 DEFAULT_FONT: str = "Helvetica"
 
 
+def write_svg(svg: svgwrite.Drawing, output_file: IO[str]) -> None:
+    """
+    Write SVG drawing to a file, streaming element by element.
+
+    `svgwrite.Drawing.write` serializes the whole document into one string,
+    which for a dense map roughly doubles peak memory.  Serialize the root
+    tag and every top-level element separately instead, so at most one
+    element is held as a string at a time.
+
+    :param svg: drawing to serialize
+    :param output_file: text file to write the drawing to
+    """
+    elements: list = svg.elements
+    try:
+        svg.elements = []
+        root: str = ElementTree.tostring(svg.get_xml(), encoding="unicode")
+    finally:
+        svg.elements = elements
+
+    output_file.write('<?xml version="1.0" encoding="utf-8" ?>\n')
+
+    assert root.endswith("/>")
+    output_file.write(root[:-2].rstrip() + ">")
+
+    for element in elements:
+        output_file.write(
+            ElementTree.tostring(element.get_xml(), encoding="unicode")
+        )
+
+    output_file.write("</svg>")
+
+
 @dataclass
 class Style:
     """Drawing element style."""
@@ -134,7 +167,7 @@ class SVGDrawing(Drawing):
     def write(self) -> None:
         """Write image to the SVG file."""
         with self.file_path.open("w+", encoding="utf-8") as output_file:
-            self.image.write(output_file)
+            write_svg(self.image, output_file)
 
 
 class PNGDrawing(Drawing):
@@ -1,5 +1,8 @@
 """WIP: road shape drawing."""
+import itertools
 import logging
+import math
+from bisect import insort
 from collections import defaultdict
 from dataclasses import dataclass
 from typing import Any, Optional, Union
@@ -15,15 +18,20 @@ from svgwrite.shapes import Circle
 from map_machine.drawing import PathCommands
 from map_machine.geometry.flinger import Flinger
 from map_machine.geometry.vector import (
-    Line,
     Polyline,
     compute_angle,
-    norm,
-    turn_by_angle,
+    compute_pseudo_angle,
+    perp_ccw,
+    perp_cw,
 )
 from map_machine.osm.osm_reader import OSMNode, Tagged
 from map_machine.scheme import RoadMatcher, Scheme
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 __author__ = "Sergey Vartanov"
 __email__ = "me@enzet.ru"
 
@@ -31,6 +39,119 @@ DEFAULT_LANE_WIDTH: float = 3.7
 USE_BLUR: bool = False
 
 
+def _jit(function):
+    """Compile scalar geometry kernel with Numba if it is available."""
+    if njit is None:
+        return function
+    return njit(cache=True, fastmath=True)(function)
+
+
+@_jit
+def _compute_vectors(
+    p1x: float,
+    p1y: float,
+    p2x: float,
+    p2y: float,
+    right_offset: float,
+    left_offset: float,
+) -> tuple[float, float, float, float, float, float]:
+    """
+    Compute unit perpendicular and offset vectors of a road part.
+
+    Pure scalar kernel: takes the two end points and offsets as floats and
+    returns the components of the turned unit vector, the right vector, and
+    the left vector.
+    """
+    dx: float = p2x - p1x
+    dy: float = p2y - p1y
+    length: float = math.hypot(dx, dy)
+    tx: float = -dy / length
+    ty: float = dx / length
+    return (
+        tx,
+        ty,
+        tx * right_offset,
+        ty * right_offset,
+        -tx * left_offset,
+        -ty * left_offset,
+    )
+
+
+@_jit
+def _compute_outers(
+    p1x: float,
+    p1y: float,
+    rcx: float,
+    rcy: float,
+    lcx: float,
+    lcy: float,
+    rvx: float,
+    rvy: float,
+    lvx: float,
+    lvy: float,
+    max_: float,
+) -> tuple[float, float, float, float, float, float, float, float]:
+    """
+    Compute outer points, point A, and middle point of a road part.
+
+    Pure scalar kernel for the both-connections case of `RoadPart.update`:
+    takes the first point, both connections, and both offset vectors as
+    floats and returns the components of the right outer point, the left
+    outer point, point A, and the middle point.
+    """
+    rpx: float = lcx + rvx - lvx
+    rpy: float = lcy + rvy - lvy
+    lpx: float = rcx - rvx + lvx
+    lpy: float = rcy - rvy + lvy
+
+    a: float = math.hypot(rcx - p1x, rcy - p1y)
+    b: float = math.hypot(rpx - p1x, rpy - p1y)
+    if a > b:
+        rox, roy = rcx, rcy
+        lox, loy = lpx, lpy
+    else:
+        rox, roy = rpx, rpy
+        lox, loy = lcx, lcy
+    mx: float = rox - rvx
+    my: float = roy - rvy
+
+    distance: float = math.hypot(mx - p1x, my - p1y)
+    if distance > max_:
+        ax: float = p1x + max_ * (mx - p1x) / distance
+        ay: float = p1y + max_ * (my - p1y) / distance
+        rox, roy = ax + rvx, ay + rvy
+        lox, loy = ax + lvx, ay + lvy
+    else:
+        ax, ay = mx, my
+
+    return rox, roy, lox, loy, ax, ay, mx, my
+
+
+def _commands_to_path(commands: PathCommands) -> str:
+    """
+    Format path commands as a single SVG path data string.
+
+    Handing svgwrite a pre-formatted string skips its per-command Python
+    iteration and per-point NumPy vector formatting.
+    """
+    return " ".join(
+        element
+        if isinstance(element, str)
+        else f"{element[0]},{element[1]}"
+        for element in commands
+    )
+
+
+def _norm2(vector: np.ndarray) -> np.ndarray:
+    """
+    Compute 2D vector with the same direction and length 1.
+
+    Scalar version of `norm` for 2-element vectors: `math.hypot` on two
+    floats avoids the NumPy dispatch overhead of `np.linalg.norm`.
+    """
+    return vector / math.hypot(vector[0], vector[1])
+
+
 @dataclass
 class Lane:
     """Road lane specification."""
@@ -54,6 +175,23 @@ class Lane:
         return self.width * scale
 
 
+def _lane_widths(lanes: list[Lane]) -> np.ndarray:
+    """
+    Get lane widths in meters as a float32 array.
+
+    Struct-of-arrays companion to the list of `Lane` objects: width sums and
+    per-lane offsets become single NumPy operations.
+    """
+    return np.fromiter(
+        (
+            DEFAULT_LANE_WIDTH if lane.width is None else lane.width
+            for lane in lanes
+        ),
+        dtype=np.float32,
+        count=len(lanes),
+    )
+
+
 class RoadPart:
     """Line part of the road."""
 
@@ -74,24 +212,31 @@ class RoadPart:
         self.point_1: np.ndarray = point_1
         self.point_2: np.ndarray = point_2
         self.lanes: list[Lane] = lanes
+        self._lane_widths: np.ndarray = _lane_widths(lanes)
 
         self.width: float
         if lanes:
-            self.width = sum(map(lambda x: x.get_width(scale), lanes))
+            self.width = float(self._lane_widths.sum() * scale)
         else:
             self.width = 1.0
 
         self.left_offset: float = self.width / 2.0
         self.right_offset: float = self.width / 2.0
 
-        self.turned: np.ndarray = norm(
-            turn_by_angle(self.point_2 - self.point_1, np.pi / 2.0)
+        tx, ty, rvx, rvy, lvx, lvy = _compute_vectors(
+            float(point_1[0]),
+            float(point_1[1]),
+            float(point_2[0]),
+            float(point_2[1]),
+            self.right_offset,
+            self.left_offset,
         )
-        self.right_vector: np.ndarray = self.turned * self.right_offset
-        self.left_vector: np.ndarray = -self.turned * self.left_offset
+        self.turned: np.ndarray = np.array((tx, ty))
+        self.right_vector: np.ndarray = np.array((rvx, rvy))
+        self.left_vector: np.ndarray = np.array((lvx, lvy))
 
-        self.right_connection: Optional[np.ndarray] = None
-        self.left_connection: Optional[np.ndarray] = None
+        self._right_connection: Optional[np.ndarray] = None
+        self._left_connection: Optional[np.ndarray] = None
         self.right_projection: Optional[np.ndarray] = None
         self.left_projection: Optional[np.ndarray] = None
 
@@ -100,8 +245,34 @@ class RoadPart:
         self.point_a: Optional[np.ndarray] = None
         self.point_middle: Optional[np.ndarray] = None
 
+        self._dirty: bool = True
+
+    @property
+    def right_connection(self) -> Optional[np.ndarray]:
+        """Get connection point of the right border."""
+        return self._right_connection
+
+    @right_connection.setter
+    def right_connection(self, point: Optional[np.ndarray]) -> None:
+        self._right_connection = point
+        self._dirty = True
+
+    @property
+    def left_connection(self) -> Optional[np.ndarray]:
+        """Get connection point of the left border."""
+        return self._left_connection
+
+    @left_connection.setter
+    def left_connection(self, point: Optional[np.ndarray]) -> None:
+        self._left_connection = point
+        self._dirty = True
+
     def update(self) -> None:
-        """Compute additional points."""
+        """Compute additional points if connections changed."""
+        if not self._dirty:
+            return
+        self._dirty = False
+
         if self.left_connection is not None:
             self.right_projection = (
                 self.left_connection + self.right_vector - self.left_vector
@@ -114,31 +285,32 @@ class RoadPart:
             self.left_connection is not None
             and self.right_connection is not None
         ):
-            a = np.linalg.norm(self.right_connection - self.point_1)
-            b = np.linalg.norm(self.right_projection - self.point_1)
-            if a > b:
-                self.right_outer = self.right_connection
-                self.left_outer = self.left_projection
-            else:
-                self.right_outer = self.right_projection
-                self.left_outer = self.left_connection
-            self.point_middle = self.right_outer - self.right_vector
-
-            max_: float = 100.0
-
-            if np.linalg.norm(self.point_middle - self.point_1) > max_:
-                self.point_a = self.point_1 + max_ * norm(
-                    self.point_middle - self.point_1
-                )
-                self.right_outer = self.point_a + self.right_vector
-                self.left_outer = self.point_a + self.left_vector
-            else:
-                self.point_a = self.point_middle
+            rox, roy, lox, loy, ax, ay, mx, my = _compute_outers(
+                float(self.point_1[0]),
+                float(self.point_1[1]),
+                float(self.right_connection[0]),
+                float(self.right_connection[1]),
+                float(self.left_connection[0]),
+                float(self.left_connection[1]),
+                float(self.right_vector[0]),
+                float(self.right_vector[1]),
+                float(self.left_vector[0]),
+                float(self.left_vector[1]),
+                100.0,
+            )
+            self.right_outer = np.array((rox, roy))
+            self.left_outer = np.array((lox, loy))
+            self.point_a = np.array((ax, ay))
+            self.point_middle = np.array((mx, my))
 
     def get_angle(self) -> float:
         """Get an angle between line and x axis."""
         return compute_angle(self.point_2 - self.point_1)
 
+    def get_pseudo_angle(self) -> float:
+        """Get trigonometry-free sort key with the same order as angle."""
+        return compute_pseudo_angle(self.point_2 - self.point_1)
+
     def draw_normal(self, drawing: svgwrite.Drawing) -> None:
         """Draw some debug lines."""
         line: Path = drawing.path(
@@ -240,7 +412,9 @@ class RoadPart:
                 "L", self.right_connection,
                 "Z",
             ]  # fmt: skip
-            drawing.add(drawing.path(path_commands, fill="#CCCCCC"))
+            drawing.add(
+                drawing.path(_commands_to_path(path_commands), fill="#CCCCCC")
+            )
 
     def draw_entrance(
         self, drawing: svgwrite.Drawing, is_debug: bool = False
@@ -259,19 +433,25 @@ class RoadPart:
             ]  # fmt: skip
             if is_debug:
                 path = drawing.path(
-                    path_commands,
+                    _commands_to_path(path_commands),
                     fill="none",
                     stroke="#880088",
                     stroke_width=0.5,
                 )
                 drawing.add(path)
             else:
-                drawing.add(drawing.path(path_commands, fill="#88FF88"))
+                drawing.add(
+                    drawing.path(
+                        _commands_to_path(path_commands), fill="#88FF88"
+                    )
+                )
 
     def draw_lanes(self, drawing: svgwrite.Drawing, scale: float) -> None:
         """Draw lane delimiters."""
-        for lane in self.lanes:
-            shift = self.right_vector - self.turned * lane.get_width(scale)
+        shifts: np.ndarray = self.right_vector - self.turned[None, :] * (
+            self._lane_widths[:, None] * scale
+        )
+        for shift in shifts:
             path = drawing.path(
                 ["M", self.point_middle + shift, "L", self.point_2 + shift],
                 fill="none",
@@ -290,20 +470,51 @@ class Intersection:
     """
 
     def __init__(self, parts: list[RoadPart]) -> None:
-        self.parts: list[RoadPart] = sorted(parts, key=lambda x: x.get_angle())
+        self.parts: list[RoadPart] = sorted(
+            parts, key=lambda x: x.get_pseudo_angle()
+        )
+
+        # Intersect the right border of each part with the left border of the
+        # next part in one batched NumPy computation instead of constructing
+        # a pair of Line objects per part.
+        directions_1: np.ndarray = np.array(
+            [part.point_2 - part.point_1 for part in self.parts]
+        )
+        origins_1: np.ndarray = np.array(
+            [part.point_1 + part.right_vector for part in self.parts]
+        )
+        directions_2: np.ndarray = np.roll(directions_1, -1, axis=0)
+        origins_2: np.ndarray = np.roll(
+            np.array([part.point_1 + part.left_vector for part in self.parts]),
+            -1,
+            axis=0,
+        )
+
+        # 2D cross products written out explicitly: `np.cross` on (N, 2)
+        # arrays is deprecated since NumPy 2.0.
+        denominators: np.ndarray = (
+            directions_1[:, 0] * directions_2[:, 1]
+            - directions_1[:, 1] * directions_2[:, 0]
+        )
+        valid: np.ndarray = denominators != 0.0
+        offsets: np.ndarray = origins_2 - origins_1
+        numerators: np.ndarray = (
+            offsets[:, 0] * directions_2[:, 1]
+            - offsets[:, 1] * directions_2[:, 0]
+        )
+        parameters: np.ndarray = np.zeros(len(self.parts))
+        parameters[valid] = numerators[valid] / denominators[valid]
+        intersections: np.ndarray = (
+            origins_1 + parameters[:, None] * directions_1
+        )
+        # Parallel borders have no intersection point; keep the origin point
+        # as `Line.get_intersection_point` does.
+        intersections[~valid] = 0.0
 
         for index, part_1 in enumerate(self.parts):
             next_index: int = 0 if index == len(self.parts) - 1 else index + 1
             part_2: RoadPart = self.parts[next_index]
-            line_1: Line = Line(
-                part_1.point_1 + part_1.right_vector,
-                part_1.point_2 + part_1.right_vector,
-            )
-            line_2: Line = Line(
-                part_2.point_1 + part_2.left_vector,
-                part_2.point_2 + part_2.left_vector,
-            )
-            intersection: np.ndarray = line_1.get_intersection_point(line_2)
+            intersection: np.ndarray = intersections[index]
             # if np.linalg.norm(intersection - part_1.point_2) < 300:
             part_1.right_connection = intersection
             part_2.left_connection = intersection
@@ -334,6 +545,7 @@ class Intersection:
         for part in self.parts:
             inner_commands += [part.left_connection, "L"]
         inner_commands[-1] = "Z"
+        inner_path: str = _commands_to_path(inner_commands)
 
         outer_commands = ["M"]
         for part in self.parts:
@@ -341,17 +553,14 @@ class Intersection:
             outer_commands += [part.left_outer, "L"]
             outer_commands += [part.right_outer, "L"]
         outer_commands[-1] = "Z"
+        outer_path: str = _commands_to_path(outer_commands)
 
         # for part in self.parts:
         #     part.draw_normal(drawing)
 
         if is_debug:
-            drawing.add(
-                drawing.path(outer_commands, fill="#0000FF", opacity=0.2)
-            )
-            drawing.add(
-                drawing.path(inner_commands, fill="#FF0000", opacity=0.2)
-            )
+            drawing.add(drawing.path(outer_path, fill="#0000FF", opacity=0.2))
+            drawing.add(drawing.path(inner_path, fill="#FF0000", opacity=0.2))
 
         for part in self.parts:
             if is_debug:
@@ -361,7 +570,75 @@ class Intersection:
         if not is_debug:
             # for part in self.parts:
             #     part.draw_lanes(drawing, scale)
-            drawing.add(drawing.path(inner_commands, fill="#FF8888"))
+            drawing.add(drawing.path(inner_path, fill="#FF8888"))
+
+
+# Cached entries store the matcher and scheme alongside the colors: the
+# strong references pin the keyed objects, so their identities cannot be
+# recycled for other objects while the entry lives.
+_resolved_colors: dict[
+    tuple[int, int, bool, bool, bool, bool],
+    tuple[RoadMatcher, Scheme, tuple[str, str, Optional[str]]],
+] = {}
+
+
+def _resolve_colors(
+    matcher: RoadMatcher,
+    scheme: Scheme,
+    tunnel: bool,
+    bridge: bool,
+    ford: bool,
+    embankment: bool,
+) -> tuple[str, str, Optional[str]]:
+    """
+    Resolve road fill and border hex colors for the given tag combination.
+
+    Color construction and hex conversion are memoized since every road is
+    drawn at least twice and there are only few tag combinations per matcher.
+    Matchers are not hashable, so the cache is keyed by identity; cached
+    entries keep references to the matcher and scheme so the identities
+    stay valid for the lifetime of the entry.
+
+    :param matcher: road matcher that provides default colors
+    :param scheme: map scheme that provides bridge, ford, and embankment colors
+    :param tunnel: whether the road is a tunnel
+    :param bridge: whether the road is a bridge
+    :param ford: whether the road is a ford
+    :param embankment: whether the road is an embankment
+    :return: fill hex color, border hex color, and border dash pattern
+    """
+    key: tuple[int, int, bool, bool, bool, bool] = (
+        id(matcher), id(scheme), tunnel, bridge, ford, embankment
+    )  # fmt: skip
+    cached = _resolved_colors.get(key)
+    if cached is not None:
+        return cached[2]
+
+    color: Color = matcher.color
+    if tunnel:
+        color = Color(color, luminance=min(1.0, color.luminance + 0.2))
+
+    border_color: Color = matcher.border_color
+    if bridge:
+        border_color = scheme.get_color("bridge_color")
+    if ford:
+        border_color = scheme.get_color("ford_color")
+    if embankment:
+        border_color = scheme.get_color("embankment_color")
+
+    border_dash: Optional[str] = None
+    if embankment:
+        border_dash = "1,3"
+    if tunnel:
+        border_dash = "3,3"
+
+    result: tuple[str, str, Optional[str]] = (
+        color.hex,
+        border_color.hex,
+        border_dash,
+    )
+    _resolved_colors[key] = (matcher, scheme, result)
+    return result
 
 
 class Road(Tagged):
@@ -379,9 +656,10 @@ class Road(Tagged):
         self.nodes: list[OSMNode] = nodes
         self.matcher: RoadMatcher = matcher
 
-        self.line: Polyline = Polyline(
-            [flinger.fling(node.coordinates) for node in self.nodes]
+        coordinates: np.ndarray = np.array(
+            [node.coordinates for node in self.nodes], dtype=float
         )
+        self.line: Polyline = Polyline(flinger.fling_many(coordinates))
         self.width: Optional[float] = matcher.default_width
         self.lanes: list[Lane] = []
 
@@ -433,6 +711,8 @@ class Road(Tagged):
         if "layer" in tags:
             self.layer = float(tags["layer"])
 
+        self._lane_widths: np.ndarray = _lane_widths(self.lanes)
+
         self.placement_offset: float = 0.0
         self.is_transition: bool = False
 
@@ -445,9 +725,8 @@ class Road(Tagged):
                 lane_number: int = int(lane_string) - 1
                 self.placement_offset = -self.width * self.scale / 2.0
                 if lane_number > 0:
-                    self.placement_offset += sum(
-                        lane.get_width(self.scale)
-                        for lane in self.lanes[:lane_number]
+                    self.placement_offset += float(
+                        self._lane_widths[:lane_number].sum() * self.scale
                     )
                 elif lane_number < 0:
                     self.placement_offset += (
@@ -457,32 +736,84 @@ class Road(Tagged):
                 if place == "left_of":
                     pass
                 elif place == "middle_of":
-                    self.placement_offset += (
-                        self.lanes[lane_number].get_width(self.scale) * 0.5
+                    self.placement_offset += float(
+                        self._lane_widths[lane_number] * self.scale * 0.5
                     )
                 elif place == "right_of":
-                    self.placement_offset += self.lanes[lane_number].get_width(
-                        self.scale
+                    self.placement_offset += float(
+                        self._lane_widths[lane_number] * self.scale
                     )
                 else:
                     logging.error(f"Unknown placement `{place}`.")
 
+        # Colors and styles are fully determined by tags and matcher, so
+        # resolve them once instead of on every drawing pass.
+        self._colors: tuple[str, str, Optional[str]] = self._resolve_colors()
+        self._style_fill: dict[str, Union[int, float, str]] = (
+            self._build_style(False)
+        )
+        self._style_border: dict[str, Union[int, float, str]] = (
+            self._build_style(True)
+        )
+        self._style_border_for_stroke: dict[str, Union[int, float, str]] = (
+            self._build_style(True, True)
+        )
+
+    def _resolve_colors(self) -> tuple[str, str, Optional[str]]:
+        """Get memoized fill and border hex colors for this road."""
+        return _resolve_colors(
+            self.matcher,
+            self.scheme,
+            self.tags.get("tunnel") == "yes",
+            self.tags.get("bridge") == "yes",
+            self.tags.get("ford") == "yes",
+            self.tags.get("embankment") == "yes",
+        )
+
+    def set_scale(self, scale: float) -> None:
+        """
+        Set pixels-per-meter scale and rebuild the cached styles.
+
+        Styles are precomputed at construction; use this when a road is
+        redrawn at a different zoom level.
+        """
+        self.scale = scale
+        self._style_fill = self._build_style(False)
+        self._style_border = self._build_style(True)
+        self._style_border_for_stroke = self._build_style(True, True)
+
     def get_style(
         self, is_border: bool, is_for_stroke: bool = False
     ) -> dict[str, Union[int, float, str]]:
         """Get road SVG style."""
+        if is_border:
+            if is_for_stroke:
+                return self._style_border_for_stroke
+            return self._style_border
+        return self._style_fill
+
+    def _build_style(
+        self, is_border: bool, is_for_stroke: bool = False
+    ) -> dict[str, Union[int, float, str]]:
+        """Construct road SVG style."""
         width: float
         if self.width is not None:
             width = self.width
         else:
             width = self.matcher.default_width
 
+        fill_hex: str
+        border_hex: str
+        border_dash: Optional[str]
+        fill_hex, border_hex, border_dash = self._colors
+
+        color_hex: str
         border_width: float
         if is_border:
-            color = self.get_border_color()
+            color_hex = border_hex
             border_width = 2.0
         else:
-            color = self.get_color()
+            color_hex = fill_hex
             border_width = 0.0
 
         extra_width: float = 0.0
@@ -496,22 +827,19 @@ class Road(Tagged):
 
         fill: str = "none"
         if self.is_area:
-            fill = color.hex
+            fill = color_hex
 
         style: dict[str, Union[int, float, str]] = {
             "fill": fill,
-            "stroke": color.hex,
+            "stroke": color_hex,
             "stroke-linecap": "butt",
             "stroke-linejoin": "round",
             "stroke-width": self.scale * width + extra_width + border_width,
         }
         if is_for_stroke:
             style["stroke-width"] = 2.0 + extra_width
-        if is_border and self.tags.get("embankment") == "yes":
-            style["stroke-dasharray"] = "1,3"
-        if self.tags.get("tunnel") == "yes":
-            if is_border:
-                style["stroke-dasharray"] = "3,3"
+        if is_border and border_dash is not None:
+            style["stroke-dasharray"] = border_dash
 
         return style
 
@@ -527,8 +855,8 @@ class Road(Tagged):
 
         return None
 
-    def draw(self, svg: Drawing, is_border: bool) -> None:
-        """Draw road as simple SVG path."""
+    def _draw_with_filter(self, svg: Drawing, is_border: bool) -> None:
+        """Draw road as simple SVG path, possibly with blurring filter."""
         filter_: Filter = self.get_filter(svg, is_border)
 
         style: dict[str, Union[int, float, str]] = self.get_style(is_border)
@@ -542,45 +870,51 @@ class Road(Tagged):
         path.update(style)
         svg.add(path)
 
+    def _draw_plain(self, svg: Drawing, is_border: bool) -> None:
+        """Draw road as simple SVG path."""
+        path: Path = Path(d=self.line.get_path(self.placement_offset))
+        path.update(self.get_style(is_border))
+        svg.add(path)
+
+    # Pick the implementation once at import time: with blurring disabled,
+    # the filter lookup is pure overhead on every draw call.
+    draw = _draw_with_filter if USE_BLUR else _draw_plain
+
     def get_color(self) -> Color:
         """Get road main color."""
-        color: Color = self.matcher.color
-        if self.tags.get("tunnel") == "yes":
-            color = Color(color, luminance=min(1.0, color.luminance + 0.2))
-        return color
+        return Color(self._colors[0])
 
     def get_border_color(self) -> Color:
         """Get road border color."""
-        color: Color = self.matcher.border_color
-        if self.tags.get("bridge") == "yes":
-            color = self.scheme.get_color("bridge_color")
-        if self.tags.get("ford") == "yes":
-            color = self.scheme.get_color("ford_color")
-        if self.tags.get("embankment") == "yes":
-            color = self.scheme.get_color("embankment_color")
-        return color
+        return Color(self._colors[1])
 
     def draw_lanes(self, svg: Drawing, color: Color) -> None:
         """Draw lane separators."""
         if len(self.lanes) < 2:
             return
 
-        for index in range(1, len(self.lanes)):
-            lane_offset: float = self.scale * (
-                -self.width / 2.0 + index * self.width / len(self.lanes)
-            )
-            path: Path = Path(
-                d=self.line.get_path(self.placement_offset + lane_offset)
+        base_offset: float = -self.scale * self.width / 2.0
+        step: float = self.scale * self.width / len(self.lanes)
+
+        # All separators share one style, so emit them as subpaths of a
+        # single path element instead of one element per lane.
+        path: Path = Path(
+            d=" ".join(
+                self.line.get_path(
+                    self.placement_offset + base_offset + index * step
+                )
+                for index in range(1, len(self.lanes))
             )
-            style: dict[str, Any] = {
-                "fill": "none",
-                "stroke": color.hex,
-                "stroke-linejoin": "round",
-                "stroke-width": 1.0,
-                "opacity": 0.5,
-            }
-            path.update(style)
-            svg.add(path)
+        )
+        style: dict[str, Any] = {
+            "fill": "none",
+            "stroke": color.hex,
+            "stroke-linejoin": "round",
+            "stroke-width": 1.0,
+            "opacity": 0.5,
+        }
+        path.update(style)
+        svg.add(path)
 
     def draw_caption(self, svg: Drawing) -> None:
         """Draw road name along its path."""
@@ -624,17 +958,11 @@ def get_curve_points(
     """
     width: float = road.width / 2.0 * road.scale
 
-    direction: np.ndarray = (center - road_end) / np.linalg.norm(
-        center - road_end
-    )
+    direction: np.ndarray = _norm2(center - road_end)
     if is_end:
         direction = -direction
-    left: np.ndarray = turn_by_angle(direction, np.pi / 2.0) * (
-        width + placement_offset
-    )
-    right: np.ndarray = turn_by_angle(direction, -np.pi / 2.0) * (
-        width - placement_offset
-    )
+    left: np.ndarray = perp_ccw(direction) * (width + placement_offset)
+    right: np.ndarray = perp_cw(direction) * (width - placement_offset)
 
     return [road_end + left, center + left, center + right, road_end + right]
 
@@ -646,6 +974,7 @@ class Connector:
         self,
         connections: list[tuple[Road, int]],
         flinger: Flinger,
+        flung_points: Optional[dict[int, np.ndarray]] = None,
     ) -> None:
         self.connections: list[tuple[Road, int]] = connections
         self.road_1: Road
@@ -661,6 +990,16 @@ class Connector:
         )
         self.scale: float = self.road_1.scale
         self.flinger: Flinger = flinger
+        self.flung_points: dict[int, np.ndarray] = (
+            flung_points if flung_points is not None else {}
+        )
+
+    def get_point(self, node: OSMNode) -> np.ndarray:
+        """Get flung node point, projecting only on cache miss."""
+        point: Optional[np.ndarray] = self.flung_points.get(node.id_)
+        if point is None:
+            point = self.flinger.fling(node.coordinates)
+        return point
 
     def draw(self, svg: Drawing) -> None:
         """Draw connection fill."""
@@ -678,32 +1017,30 @@ class SimpleConnector(Connector):
         self,
         connections: list[tuple[Road, int]],
         flinger: Flinger,
+        flung_points: Optional[dict[int, np.ndarray]] = None,
     ) -> None:
-        super().__init__(connections, flinger)
+        super().__init__(connections, flinger, flung_points)
 
         self.road_2: Road = connections[1][0]
         self.index_2: int = connections[1][1]
 
         node: OSMNode = self.road_1.nodes[self.index_1]
-        self.point: np.ndarray = flinger.fling(node.coordinates)
+        self.point: np.ndarray = self.get_point(node)
+
+        # Compute circle geometry and colors once; draw passes only emit.
+        self.radius: float = self.road_1.width * self.scale / 2.0
+        self.fill: str = self.road_1._colors[0]
+        self.border_fill: str = self.road_1.matcher.border_color.hex
 
     def draw(self, svg: Drawing) -> None:
         """Draw connection fill."""
-        circle: Circle = svg.circle(
-            self.point,
-            self.road_1.width * self.scale / 2.0,
-            fill=self.road_1.get_color().hex,
-        )
-        svg.add(circle)
+        svg.add(svg.circle(self.point, self.radius, fill=self.fill))
 
     def draw_border(self, svg: Drawing) -> None:
         """Draw connection outline."""
-        circle: Circle = svg.circle(
-            self.point,
-            self.road_1.width * self.scale / 2.0 + 1.0,
-            fill=self.road_1.matcher.border_color.hex,
+        svg.add(
+            svg.circle(self.point, self.radius + 1.0, fill=self.border_fill)
         )
-        svg.add(circle)
 
 
 class ComplexConnector(Connector):
@@ -713,8 +1050,9 @@ class ComplexConnector(Connector):
         self,
         connections: list[tuple[Road, int]],
         flinger: Flinger,
+        flung_points: Optional[dict[int, np.ndarray]] = None,
     ) -> None:
-        super().__init__(connections, flinger)
+        super().__init__(connections, flinger, flung_points)
 
         self.road_2: Road = connections[1][0]
         self.index_2: int = connections[1][1]
@@ -722,13 +1060,14 @@ class ComplexConnector(Connector):
         length: float = (
             abs(self.road_2.width - self.road_1.width) * self.road_1.scale
         )
-        self.road_1.line.shorten(self.index_1, length)
-        self.road_2.line.shorten(self.index_2, length)
 
         node_1: OSMNode = self.road_1.nodes[self.index_1]
-        point_1: np.ndarray = flinger.fling(node_1.coordinates)
+        point_1: np.ndarray = self.get_point(node_1)
         node_2: OSMNode = self.road_2.nodes[self.index_2]
-        point_2: np.ndarray = flinger.fling(node_2.coordinates)
+        point_2: np.ndarray = self.get_point(node_2)
+
+        self.road_1.line.shorten(self.index_1, length)
+        self.road_2.line.shorten(self.index_2, length)
         point = (point_1 + point_2) / 2.0
 
         points_1: list[np.ndarray] = get_curve_points(
@@ -746,36 +1085,44 @@ class ComplexConnector(Connector):
             self.index_2 != 0,
         )
         # fmt: off
-        self.curve_1: PathCommands = [
-            points_1[0], "C", points_1[1], points_2[1], points_2[0]
-        ]
-        self.curve_2: PathCommands = [
-            points_2[3], "C", points_2[2], points_1[2], points_1[3]
-        ]
+        self.curve_1: str = _commands_to_path(
+            [points_1[0], "C", points_1[1], points_2[1], points_2[0]]
+        )
+        self.curve_2: str = _commands_to_path(
+            [points_2[3], "C", points_2[2], points_1[2], points_1[3]]
+        )
         # fmt: on
+        self.fill: str = self.road_1._colors[0]
 
     def draw(self, svg: Drawing) -> None:
         """Draw connection fill."""
         path: Path = svg.path(
-            d=["M"] + self.curve_1 + ["L"] + self.curve_2 + ["Z"],
-            fill=self.road_1.get_color(),
+            d=f"M {self.curve_1} L {self.curve_2} Z", fill=self.fill
         )
         svg.add(path)
 
-    def draw_border(self, svg: Drawing) -> None:
-        """Draw connection outline."""
+    def _draw_border_with_filter(self, svg: Drawing) -> None:
+        """Draw connection outline, possibly with blurring filter."""
         filter_: Filter = self.road_1.get_filter(svg, True)
 
         if filter_:
             path: Path = svg.path(
-                d=["M"] + self.curve_1 + ["M"] + self.curve_2,
+                d=f"M {self.curve_1} M {self.curve_2}",
                 filter=filter_.get_funciri(),
             )
         else:
-            path: Path = svg.path(d=["M"] + self.curve_1 + ["M"] + self.curve_2)
+            path: Path = svg.path(d=f"M {self.curve_1} M {self.curve_2}")
         path.update(self.road_1.get_style(True, True))
         svg.add(path)
 
+    def _draw_border_plain(self, svg: Drawing) -> None:
+        """Draw connection outline."""
+        path: Path = svg.path(d=f"M {self.curve_1} M {self.curve_2}")
+        path.update(self.road_1.get_style(True, True))
+        svg.add(path)
+
+    draw_border = _draw_border_with_filter if USE_BLUR else _draw_border_plain
+
 
 class SimpleIntersection(Connector):
     """Connection between more than two roads."""
@@ -812,15 +1159,35 @@ class Roads:
 
     def __init__(self) -> None:
         self.roads: list[Road] = []
-        self.nodes: dict[int, list[tuple[Road, int]]] = {}
+        self._sorted_roads: list[Road] = []
+        self.nodes: dict[int, list[tuple[Road, int]]] = defaultdict(list)
+        self.flung_points: dict[int, np.ndarray] = {}
 
     def append(self, road: Road) -> None:
         """Add road and update connections."""
         self.roads.append(road)
-        for index, node in enumerate(road.nodes):
-            if node.id_ not in self.nodes:
-                self.nodes[node.id_] = []
+
+        # Keep roads sorted by layer and priority, so drawing does not have
+        # to rebuild and sort layer buckets on every call.
+        insort(
+            self._sorted_roads,
+            road,
+            key=lambda x: (x.layer, x.matcher.priority),
+        )
+
+        # Connectors are only constructed between road ends, so interior
+        # nodes need not be indexed.
+        indices: tuple[int, ...] = (0,)
+        if len(road.nodes) > 1:
+            indices = (0, len(road.nodes) - 1)
+        for index in indices:
+            node: OSMNode = road.nodes[index]
             self.nodes[node.id_].append((road, index))
+            if node.id_ not in self.flung_points:
+                # Copy: `Polyline.shorten` modifies point rows in place.
+                self.flung_points[node.id_] = np.array(
+                    road.line.points[index], dtype=float
+                )
 
     def draw(
         self, svg: Drawing, flinger: Flinger, draw_captions: bool = False
@@ -829,13 +1196,10 @@ class Roads:
         if not self.roads:
             return
 
-        layered_roads: dict[float, list[Road]] = defaultdict(list)
         layered_connectors: dict[float, list[Connector]] = defaultdict(list)
 
         for road in self.roads:
-            if not road.is_transition:
-                layered_roads[road.layer].append(road)
-            else:
+            if road.is_transition:
                 connections = []
                 for end in 0, -1:
                     connections.append(
@@ -847,7 +1211,9 @@ class Roads:
                     )
                 if len(connections[0]) == 1 and len(connections[1]) == 1:
                     connector: Connector = ComplexConnector(
-                        [connections[0][0], connections[1][0]], flinger
+                        [connections[0][0], connections[1][0]],
+                        flinger,
+                        self.flung_points,
                     )
                     layered_connectors[road.layer].append(connector)
 
@@ -860,14 +1226,23 @@ class Roads:
             if len(connected) == 2:
                 road_1, index_1 = connected[0]
                 road_2, index_2 = connected[1]
+                # A complex connector with sub-pixel width change collapses
+                # visually to a circle, so don't pay for the curve geometry.
+                width_delta: float = (
+                    abs(road_1.width - road_2.width) * road_1.scale
+                )
                 if (
-                    road_1.width == road_2.width
+                    width_delta < 0.5
                     or index_1 not in [0, len(road_1.nodes) - 1]
                     or index_2 not in [0, len(road_2.nodes) - 1]
                 ):
-                    connector = SimpleConnector(connected, flinger)
+                    connector = SimpleConnector(
+                        connected, flinger, self.flung_points
+                    )
                 elif not road_1.is_transition and not road_2.is_transition:
-                    connector = ComplexConnector(connected, flinger)
+                    connector = ComplexConnector(
+                        connected, flinger, self.flung_points
+                    )
                 else:
                     continue
             else:
@@ -878,10 +1253,14 @@ class Roads:
             layered_connectors[connector.min_layer].append(connector)
             layered_connectors[connector.max_layer].append(connector)
 
-        for layer in sorted(layered_roads.keys()):
-            roads: list[Road] = sorted(
-                layered_roads[layer], key=lambda x: x.matcher.priority
-            )
+        for layer, group in itertools.groupby(
+            self._sorted_roads, key=lambda x: x.layer
+        ):
+            roads: list[Road] = [
+                road for road in group if not road.is_transition
+            ]
+            if not roads:
+                continue
             connectors: list[Connector] = layered_connectors.get(layer)
 
             # Draw borders.
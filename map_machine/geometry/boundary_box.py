@@ -1,5 +1,6 @@
 """Rectangle that limit space on the map."""
 import logging
+import math
 import re
 from dataclasses import dataclass
 from typing import Optional
@@ -128,10 +129,10 @@ class BoundaryBox:
 
     def round(self) -> "BoundaryBox":
         """Round boundary box."""
-        self.left = round(self.left * 1000.0) / 1000.0 - 0.001
-        self.bottom = round(self.bottom * 1000.0) / 1000.0 - 0.001
-        self.right = round(self.right * 1000.0) / 1000.0 + 0.001
-        self.top = round(self.top * 1000.0) / 1000.0 + 0.001
+        self.left = round(self.left * 1000.0) * 0.001 - 0.001
+        self.bottom = round(self.bottom * 1000.0) * 0.001 - 0.001
+        self.right = round(self.right * 1000.0) * 0.001 + 0.001
+        self.top = round(self.top * 1000.0) * 0.001 + 0.001
 
         return self
 
@@ -149,10 +150,13 @@ class BoundaryBox:
         <longitude 1>,<latitude 1>,<longitude 2>,<latitude 2>.  Coordinates are
         rounded to three digits after comma.
         """
-        left: float = np.floor(self.left * 1000.0) / 1000.0
-        bottom: float = np.floor(self.bottom * 1000.0) / 1000.0
-        right: float = np.ceil(self.right * 1000.0) / 1000.0
-        top: float = np.ceil(self.top * 1000.0) / 1000.0
+        # `math.floor`/`math.ceil` round correctly toward -/+ infinity for
+        # negative coordinates and skip the NumPy scalar ufunc dispatch:
+        # this runs on every cache file lookup.
+        left: float = math.floor(self.left * 1000.0) * 0.001
+        bottom: float = math.floor(self.bottom * 1000.0) * 0.001
+        right: float = math.ceil(self.right * 1000.0) * 0.001
+        top: float = math.ceil(self.top * 1000.0) * 0.001
 
         return f"{left:.3f},{bottom:.3f},{right:.3f},{top:.3f}"
 
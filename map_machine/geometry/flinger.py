@@ -28,6 +28,28 @@ def pseudo_mercator(coordinates: np.ndarray) -> np.ndarray:
     return np.array((longitude, y))
 
 
+def pseudo_mercator_many(coordinates: np.ndarray) -> np.ndarray:
+    """
+    Apply spherical pseudo-Mercator projection to an array of geo coordinates.
+
+    Vectorized version of `pseudo_mercator` that processes all points with
+    NumPy ufuncs instead of one Python call per point.
+
+    :param coordinates: array of geo positions of shape (N, 2) in the form of
+        (latitude, longitude) rows
+    :return: array of positions on the plane of shape (N, 2) in the form of
+        (x, y) rows
+    """
+    result: np.ndarray = np.empty_like(coordinates, dtype=float)
+    result[:, 0] = coordinates[:, 1]
+    result[:, 1] = (
+        180.0
+        / np.pi
+        * np.log(np.tan(np.pi / 4.0 + coordinates[:, 0] * np.pi / 360.0))
+    )
+    return result
+
+
 def osm_zoom_level_to_pixels_per_meter(
     zoom_level: float, equator_length: float
 ) -> float:
@@ -53,6 +75,15 @@ class Flinger:
         """Do nothing but return coordinates unchanged."""
         return coordinates
 
+    def fling_many(self, coordinates: np.ndarray) -> np.ndarray:
+        """
+        Convert an array of geo coordinates at once.
+
+        :param coordinates: array of geo positions of shape (N, 2)
+        :return: array of positions on the plane of shape (N, 2)
+        """
+        return np.asarray(coordinates, dtype=float)
+
     def get_scale(self, coordinates: Optional[np.ndarray] = None) -> float:
         return 1.0
 
@@ -104,6 +135,25 @@ class MercatorFlinger(Flinger):
 
         return result
 
+    def fling_many(self, coordinates: np.ndarray) -> np.ndarray:
+        """
+        Convert an array of geo coordinates into plane points at once.
+
+        :param coordinates: array of geographical coordinates of shape (N, 2)
+            in the form of (latitude, longitude) rows
+        :return: array of positions on the plane of shape (N, 2)
+        """
+        result: np.ndarray = (
+            self.ratio
+            * pseudo_mercator_many(np.asarray(coordinates, dtype=float))
+            - self.min_
+        )
+
+        # Invert y axis on coordinate plane.
+        result[:, 1] = self.size[1] - result[:, 1]
+
+        return result
+
     def get_scale(self, coordinates: Optional[np.ndarray] = None) -> float:
         """
         Return pixels per meter ratio for the given geo coordinates.
@@ -129,3 +179,6 @@ class TranslateFlinger(Flinger):
 
     def fling(self, coordinates: np.ndarray) -> np.ndarray:
         return self.scale * (coordinates + self.offset)
+
+    def fling_many(self, coordinates: np.ndarray) -> np.ndarray:
+        return self.scale * (np.asarray(coordinates, dtype=float) + self.offset)
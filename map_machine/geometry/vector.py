@@ -1,5 +1,5 @@
 """Vector utility."""
-from typing import Optional
+from typing import Optional, Union
 
 import numpy as np
 
@@ -26,6 +26,24 @@ def compute_angle(vector: np.ndarray) -> float:
     return np.arctan(vector[1] / vector[0])
 
 
+def compute_pseudo_angle(vector: np.ndarray) -> float:
+    """
+    For the given vector compute a pseudo-angle in [0, 4).
+
+    The result is a monotonic function of `compute_angle`, so it induces the
+    same circular ordering, but needs no trigonometric call.  Useful as a
+    sort key.
+    """
+    dx: float = vector[0]
+    dy: float = vector[1]
+    if dx == 0.0 and dy == 0.0:
+        return 3.0
+
+    t: float = dy / (abs(dx) + abs(dy))
+    result: float = t if dx >= 0.0 else 2.0 - t
+    return result if result >= 0.0 else result + 4.0
+
+
 def turn_by_angle(vector: np.ndarray, angle: float) -> np.ndarray:
     """Turn vector by an angle."""
     return np.array(
@@ -36,20 +54,64 @@ def turn_by_angle(vector: np.ndarray, angle: float) -> np.ndarray:
     )
 
 
+def perp_ccw(vector: np.ndarray) -> np.ndarray:
+    """Turn vector by 90 degrees counterclockwise without trigonometry."""
+    return np.array((-vector[1], vector[0]))
+
+
+def perp_cw(vector: np.ndarray) -> np.ndarray:
+    """Turn vector by 90 degrees clockwise without trigonometry."""
+    return np.array((vector[1], -vector[0]))
+
+
 def norm(vector: np.ndarray) -> np.ndarray:
     """Compute vector with the same direction and length 1."""
     return vector / np.linalg.norm(vector)
 
 
+def _aligned(array: np.ndarray, alignment: int = 32) -> np.ndarray:
+    """
+    Copy array into a buffer whose data pointer is aligned.
+
+    Alignment lets NumPy use its SIMD inner loops on the whole buffer.
+
+    :param array: array to copy
+    :param alignment: required data pointer alignment in bytes
+    """
+    buffer: np.ndarray = np.empty(array.nbytes + alignment, dtype=np.uint8)
+    offset: int = (-buffer.ctypes.data) % alignment
+    aligned: np.ndarray = (
+        buffer[offset : offset + array.nbytes]
+        .view(array.dtype)
+        .reshape(array.shape)
+    )
+    aligned[...] = array
+    return aligned
+
+
 class Polyline:
-    """List of connected points."""
+    """Sequence of connected points stored as an (N, 2) float32 array."""
 
-    def __init__(self, points: list[np.ndarray]) -> None:
-        self.points: list[np.ndarray] = points
+    def __init__(self, points: Union[list[np.ndarray], np.ndarray]) -> None:
+        array: np.ndarray = np.asarray(points, dtype=np.float32)
+        if array.size == 0:
+            array = array.reshape((0, 2))
+        self.points: np.ndarray = _aligned(np.ascontiguousarray(array))
+        self._paths: dict[float, str] = {}
 
     def get_path(self, parallel_offset: float = 0.0) -> str:
         """Construct SVG path commands."""
-        points: list[np.ndarray]
+        # Points are never modified between drawing passes, so paths are
+        # constructed once per offset and reused.
+        path: Optional[str] = self._paths.get(parallel_offset)
+        if path is None:
+            path = self._construct_offset_path(parallel_offset)
+            self._paths[parallel_offset] = path
+        return path
+
+    def _construct_offset_path(self, parallel_offset: float) -> str:
+        """Construct SVG path commands for the offset polyline."""
+        points: np.ndarray
 
         if np.allclose(parallel_offset, 0.0):
             points = self.points
@@ -65,6 +127,11 @@ class Polyline:
             except (ValueError, NotImplementedError):
                 points = self.points
 
+        return self._construct_path(points)
+
+    @staticmethod
+    def _construct_path(points: np.ndarray) -> str:
+        """Format points as SVG path commands."""
         return (
             "M "
             + " L ".join(f"{point[0]},{point[1]}" for point in points)
@@ -75,9 +142,8 @@ class Polyline:
         """Make shorten part specified with index."""
         index_2: int = 1 if index == 0 else -2
         diff: np.ndarray = self.points[index_2] - self.points[index]
-        self.points[index] = (
-            self.points[index] + diff / np.linalg.norm(diff) * length
-        )
+        self.points[index] += diff / np.hypot(diff[0], diff[1]) * length
+        self._paths.clear()
 
 
 class Line:
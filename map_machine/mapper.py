@@ -14,7 +14,7 @@ from svgwrite.shapes import Rect
 
 from map_machine import __project__
 from map_machine.constructor import Constructor
-from map_machine.drawing import draw_text
+from map_machine.drawing import draw_text, write_svg
 from map_machine.feature.building import Building, draw_walls, BUILDING_SCALE
 from map_machine.feature.road import Intersection, Road, RoadPart
 from map_machine.figure import StyledFigure
@@ -55,6 +55,16 @@ class Map:
         if color := self.configuration.background_color():
             self.background_color = color
 
+    def reset(self, flinger: Flinger, svg: svgwrite.Drawing) -> None:
+        """
+        Prepare the painter for another drawing with the same configuration.
+
+        :param flinger: converter for geo coordinates
+        :param svg: drawing to fill
+        """
+        self.flinger = flinger
+        self.svg = svg
+
     def draw(self, constructor: Constructor) -> None:
         """Draw map."""
         self.svg.add(
@@ -396,4 +406,4 @@ def render_map(arguments: argparse.Namespace) -> None:
 
     logging.info(f"Writing output SVG to {arguments.output_file_name}...")
     with open(arguments.output_file_name, "w", encoding="utf-8") as output_file:
-        svg.write(output_file)
+        write_svg(svg, output_file)
@@ -1,6 +1,7 @@
 """Getting OpenStreetMap data from the web."""
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -58,6 +59,48 @@ def get_osm(
     return content.decode("utf-8")
 
 
+def get_osm_batch(
+    boundary_boxes: list[BoundaryBox],
+    cache_file_paths: list[Path],
+    to_update: bool = False,
+) -> list[str]:
+    """
+    Download OSM data for several boundary boxes, overlapping the requests.
+
+    Each request still pays the full server round trip, but the round trips
+    run concurrently instead of back to back, so downloading a set of tiles
+    costs roughly one request latency.  Requests for identical boundary
+    boxes are issued only once.
+
+    :param boundary_boxes: borders of the map parts to download
+    :param cache_file_paths: cache files to store downloaded OSM data
+    :param to_update: update cache files
+    :return: OSM data for every requested boundary box, in request order
+    """
+    contents: dict[str, str] = {}
+    unique: dict[str, tuple[BoundaryBox, Path]] = {}
+
+    for boundary_box, cache_file_path in zip(
+        boundary_boxes, cache_file_paths
+    ):
+        unique.setdefault(
+            boundary_box.get_format(), (boundary_box, cache_file_path)
+        )
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = executor.map(
+            lambda arguments: get_osm(*arguments, to_update=to_update),
+            unique.values(),
+        )
+        for format_, content in zip(unique, results):
+            contents[format_] = content
+
+    return [
+        contents[boundary_box.get_format()]
+        for boundary_box in boundary_boxes
+    ]
+
+
 def get_data(address: str, parameters: dict[str, str]) -> bytes:
     """
     Construct Internet page URL and get its descriptor.
@@ -1,6 +1,7 @@
 """Parse OSM XML file."""
 import json
 import logging
+import mmap
 import re
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -25,6 +26,9 @@ MILES_PATTERN: re.Pattern = re.compile("^(?P<value>\\d*\\.?\\d*)\\s*mi$")
 
 EARTH_EQUATOR_LENGTH: float = 40_075_017.0
 
+# Size of XML pieces fed to the streaming parser.
+XML_CHUNK_SIZE: int = 1 << 22
+
 Tags = dict[str, str]
 
 # See https://wiki.openstreetmap.org/wiki/Lifecycle_prefix#Stages_of_decay
@@ -439,10 +443,60 @@ class OSMData:
 
         See https://wiki.openstreetmap.org/wiki/OSM_XML
 
+        The file is memory-mapped and streamed through a pull parser;
+        processed elements are discarded as soon as they are handled, so
+        peak memory never includes the whole XML tree.
+
         :param file_name: input XML file
         :return: parsed map
         """
-        self.parse_osm(ElementTree.parse(file_name).getroot())
+        with file_name.open("rb") as input_file:
+            try:
+                mapped: mmap.mmap = mmap.mmap(
+                    input_file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            except ValueError:
+                # Empty files cannot be mapped.
+                self.parse_osm(ElementTree.parse(input_file).getroot())
+                return
+
+            try:
+                self._parse_osm_stream(memoryview(mapped))
+            finally:
+                mapped.close()
+
+    def _parse_osm_stream(self, view: memoryview) -> None:
+        """
+        Parse OSM XML from a buffer without building the whole tree.
+
+        Top level elements are dispatched on their closing tag and the
+        accumulated tree is cleared right after, so only the element being
+        parsed is alive at any moment.
+
+        :param view: XML bytes
+        """
+        parser: ElementTree.XMLPullParser = ElementTree.XMLPullParser(
+            events=("start", "end")
+        )
+        root: Optional[Element] = None
+
+        for position in range(0, len(view), XML_CHUNK_SIZE):
+            parser.feed(view[position : position + XML_CHUNK_SIZE])
+            for event, element in parser.read_events():
+                if event == "start":
+                    if root is None:
+                        root = element
+                elif element.tag in (
+                    "bounds",
+                    "object",
+                    "node",
+                    "way",
+                    "relation",
+                ):
+                    self._parse_element(element)
+                    root.clear()
+
+        parser.close()
 
     def parse_osm_text(self, text: str) -> None:
         """
@@ -469,17 +523,29 @@ class OSMData:
         :param parse_relations: whether relations should be parsed
         """
         for element in root:
-            if element.tag == "bounds":
-                self.parse_bounds(element)
-            elif element.tag == "object":
-                self.parse_object(element)
-            elif element.tag == "node" and parse_nodes:
-                node = OSMNode.from_xml_structure(element)
-                self.add_node(node)
-            elif element.tag == "way" and parse_ways:
-                self.add_way(OSMWay.from_xml_structure(element, self.nodes))
-            elif element.tag == "relation" and parse_relations:
-                self.add_relation(OSMRelation.from_xml_structure(element))
+            self._parse_element(
+                element, parse_nodes, parse_ways, parse_relations
+            )
+
+    def _parse_element(
+        self,
+        element: Element,
+        parse_nodes: bool = True,
+        parse_ways: bool = True,
+        parse_relations: bool = True,
+    ) -> None:
+        """Parse one top level OSM XML element."""
+        if element.tag == "bounds":
+            self.parse_bounds(element)
+        elif element.tag == "object":
+            self.parse_object(element)
+        elif element.tag == "node" and parse_nodes:
+            node = OSMNode.from_xml_structure(element)
+            self.add_node(node)
+        elif element.tag == "way" and parse_ways:
+            self.add_way(OSMWay.from_xml_structure(element, self.nodes))
+        elif element.tag == "relation" and parse_relations:
+            self.add_relation(OSMRelation.from_xml_structure(element))
 
     def parse_bounds(self, element: Element) -> None:
         """Parse view box from XML element."""
@@ -360,6 +360,19 @@ class Scheme:
         # Storage for created icon sets.
         self.cache: dict[str, tuple[IconSet, int]] = {}
 
+        # Raw structure, kept to rebuild the scheme when pickling.
+        self._content: dict[str, Any] = content
+
+    def __reduce__(self) -> tuple:
+        """
+        Pickle as the raw structure.
+
+        Parsed matchers hold `colour.Color` objects, which cannot be
+        pickled; reconstructing from the structure is cheap and lets
+        schemes cross process boundaries (e.g. to tile rendering workers).
+        """
+        return Scheme, (self._content,)
+
     @classmethod
     def from_file(cls, file_name: Path) -> Optional["Scheme"]:
         """
@@ -5,26 +5,37 @@ See https://wiki.openstreetmap.org/wiki/Tiles
 """
 import argparse
 import logging
+import math
+import pickle
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import cairosvg
 import numpy as np
-import svgwrite
-from PIL import Image
 
-from map_machine.constructor import Constructor
 from map_machine.geometry.boundary_box import BoundaryBox
-from map_machine.geometry.flinger import MercatorFlinger
-from map_machine.map_configuration import MapConfiguration
-from map_machine.mapper import Map
-from map_machine.osm.osm_getter import NetworkError, get_osm
+from map_machine.osm.osm_getter import NetworkError, get_osm, get_osm_batch
 from map_machine.osm.osm_reader import OSMData
-from map_machine.pictogram.icon import ShapeExtractor
-from map_machine.scheme import Scheme
-from map_machine.workspace import workspace
+
+# The drawing stack (svgwrite, cairosvg, Pillow, constructor, mapper, icon
+# extraction) costs hundreds of milliseconds to import, which is wasted for
+# callers that only need tile arithmetic — and multiplied by worker count
+# when rendering on a process pool.  It is imported inside the functions
+# that draw.
+if TYPE_CHECKING:
+    import svgwrite
+
+    from map_machine.geometry.flinger import MercatorFlinger
+    from map_machine.map_configuration import MapConfiguration
+    from map_machine.pictogram.icon import ShapeExtractor
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 __author__ = "Sergey Vartanov"
 __email__ = "me@enzet.ru"
@@ -32,12 +43,202 @@ __email__ = "me@enzet.ru"
 TILE_WIDTH, TILE_HEIGHT = 256, 256
 EXTEND_TO_BIGGER_TILE: bool = False
 
+# Output buffer size for SVG files.  Streamed SVG elements are small, so a
+# large buffer collapses thousands of write system calls into a few.
+SVG_WRITE_BUFFER_SIZE: int = 1 << 20
 
-@dataclass
+
+def _jit(function):
+    """Compile tile coordinate kernel with Numba if it is available."""
+    if njit is None:
+        return function
+    return njit(cache=True, fastmath=True)(function)
+
+
+@_jit
+def _tile_indices_from_coordinates(
+    latitudes: np.ndarray, longitudes: np.ndarray, scale: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Convert geo coordinate arrays into tile index arrays.
+
+    Indices are stored as 32-bit integers: they fit any zoom level the
+    project supports (at most 2 ** 20 tiles per axis) and halve the memory
+    traffic of large pyramid batches.
+    """
+    xs: np.ndarray = ((longitudes + 180.0) / 360.0 * scale).astype(np.int32)
+    ys: np.ndarray = (
+        (1.0 - np.arcsinh(np.tan(np.radians(latitudes))) / np.pi)
+        / 2.0
+        * scale
+    ).astype(np.int32)
+    return xs, ys
+
+
+@_jit
+def _coordinates_from_tile_indices(
+    xs: np.ndarray, ys: np.ndarray, scale: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Convert tile index arrays into north-west corner coordinate arrays."""
+    longitudes: np.ndarray = xs / scale * 360.0 - 180.0
+    latitudes: np.ndarray = np.degrees(
+        np.arctan(np.sinh(np.pi * (1.0 - 2.0 * ys / scale)))
+    )
+    return latitudes, longitudes
+
+
+def load_cached_osm_data(
+    boundary_box: BoundaryBox, cache_file_path: Path
+) -> OSMData:
+    """
+    Download (if not cached) and parse OSM data for a boundary box.
+
+    Parsing OSM XML usually costs more than reading the cached file, so the
+    parsed data is additionally pickled next to the `.osm` file and reused
+    while it is newer than the XML.
+
+    :param boundary_box: borders of the map part to load
+    :param cache_file_path: cache file to store downloaded OSM data
+    """
+    pickle_path: Path = cache_file_path.with_suffix(".osm.pickle")
+
+    if (
+        pickle_path.is_file()
+        and cache_file_path.is_file()
+        and pickle_path.stat().st_mtime >= cache_file_path.stat().st_mtime
+    ):
+        try:
+            with pickle_path.open("rb") as pickle_file:
+                return pickle.load(pickle_file)
+        except (pickle.UnpicklingError, EOFError, AttributeError):
+            logging.warning("Invalid cache file %s, reparsing.", pickle_path)
+
+    get_osm(boundary_box, cache_file_path)
+
+    osm_data: OSMData = OSMData()
+    osm_data.parse_osm_file(cache_file_path)
+
+    with pickle_path.open("wb") as pickle_file:
+        pickle.dump(osm_data, pickle_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    return osm_data
+
+
+@lru_cache(maxsize=65536)
+def _get_tile_coordinates(
+    x: int, y: int, zoom_level: int
+) -> tuple[float, float]:
+    """
+    Compute geo coordinates of the north-west corner of a tile.
+
+    Memoized: every tile corner is requested several times per draw, and
+    neighboring tiles share corners.
+
+    :return: coordinates in the form of (latitude, longitude)
+    """
+    scale: float = 2.0**zoom_level
+    lon_deg: float = x / scale * 360.0 - 180.0
+    lat_rad: float = math.atan(math.sinh(math.pi * (1 - 2 * y / scale)))
+    return math.degrees(lat_rad), lon_deg
+
+
+@lru_cache(maxsize=4096)
+def _get_tile_flinger(
+    x: int, y: int, zoom_level: int, equator_length: float
+) -> "MercatorFlinger":
+    """
+    Get projection for a tile, reusing it between draws.
+
+    The flinger is immutable after construction and depends only on the
+    tile and the equator length, so redraws of the same tile — and its
+    size array, which would otherwise be reallocated per draw — share one
+    instance.
+    """
+    from map_machine.geometry.flinger import MercatorFlinger
+
+    top, left = _get_tile_coordinates(x, y, zoom_level)
+    bottom, right = _get_tile_coordinates(x + 1, y + 1, zoom_level)
+
+    return MercatorFlinger(
+        BoundaryBox(left, bottom, right, top), zoom_level, equator_length
+    )
+
+
+# One-entry cache of (Constructor, Map) reused for consecutive tiles that
+# share OSM data and configuration.  The cached pair holds strong
+# references to its keys' objects, so the identity key cannot go stale.
+_painter_cache: dict = {}
+
+
+def _get_constructor_and_painter(
+    osm_data: OSMData,
+    flinger: "MercatorFlinger",
+    svg: "svgwrite.Drawing",
+    configuration: "MapConfiguration",
+) -> tuple:
+    """Get constructor and painter, reusing scheme and icon wiring."""
+    from map_machine.constructor import Constructor
+    from map_machine.mapper import Map
+
+    key: tuple[int, int] = (id(osm_data), id(configuration))
+    cached = _painter_cache.get(key)
+
+    if cached is None:
+        constructor: Constructor = Constructor(
+            osm_data, flinger, get_icon_extractor(), configuration
+        )
+        painter: Map = Map(
+            flinger=flinger, svg=svg, configuration=configuration
+        )
+        _painter_cache.clear()
+        _painter_cache[key] = (constructor, painter)
+    else:
+        constructor, painter = cached
+        constructor.reset(flinger)
+        painter.reset(flinger, svg)
+
+    return constructor, painter
+
+
+_worker_arguments: tuple = ()
+
+
+def _initialize_tile_worker(
+    osm_data: OSMData, directory: Path, configuration: "MapConfiguration"
+) -> None:
+    """Store shared drawing arguments in a tile rendering worker process."""
+    global _worker_arguments
+    _worker_arguments = (osm_data, directory, configuration)
+
+
+def _draw_tile(tile: "Tile") -> None:
+    """Draw one tile in a tile rendering worker process."""
+    tile.draw_with_osm_data(*_worker_arguments)
+
+
+@lru_cache(maxsize=None)
+def get_icon_extractor() -> "ShapeExtractor":
+    """
+    Get shared shape extractor.
+
+    Parsing the icon shape files is expensive and the result is never
+    modified, so one extractor is shared by all tiles.
+    """
+    from map_machine.pictogram.icon import ShapeExtractor
+    from map_machine.workspace import workspace
+
+    return ShapeExtractor(workspace.ICONS_PATH, workspace.ICONS_CONFIG_PATH)
+
+
+@dataclass(slots=True, frozen=True)
 class Tile:
     """
     OpenStreetMap tile, square bitmap graphics displayed in a grid arrangement
     to show a map.
+
+    Frozen with slots: pyramid workflows create thousands of tiles, and
+    slots avoid the per-instance dictionary while frozen makes tiles
+    hashable.
     """
 
     x: int
@@ -54,46 +255,83 @@ class Tile:
         :param coordinates: any coordinates inside tile, (latitude, longitude)
         :param zoom_level: zoom level in OpenStreetMap terminology
         """
-        lat_rad: np.ndarray = np.radians(coordinates[0])
+        # Scalar `math` functions skip the NumPy ufunc dispatch that
+        # dominates single point conversion.
+        lat_rad: float = math.radians(float(coordinates[0]))
         scale: float = 2.0**zoom_level
-        x: int = int((coordinates[1] + 180.0) / 360.0 * scale)
-        y: int = int((1.0 - np.arcsinh(np.tan(lat_rad)) / np.pi) / 2.0 * scale)
+        x: int = int((float(coordinates[1]) + 180.0) / 360.0 * scale)
+        y: int = int(
+            (1.0 - math.asinh(math.tan(lat_rad)) / math.pi) / 2.0 * scale
+        )
         return cls(x, y, zoom_level)
 
+    @staticmethod
+    def from_coordinates_batch(
+        coordinates: np.ndarray, zoom_level: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Compute tile indices for an array of geo coordinates at once.
+
+        Vectorized version of `from_coordinates` that returns tile indices as
+        two arrays instead of a list of `Tile` objects.
+
+        :param coordinates: array of geo positions of shape (N, 2) in the form
+            of (latitude, longitude) rows
+        :param zoom_level: zoom level in OpenStreetMap terminology
+        :return: arrays of tile x and y indices
+        """
+        return _tile_indices_from_coordinates(
+            np.ascontiguousarray(coordinates[:, 0], dtype=float),
+            np.ascontiguousarray(coordinates[:, 1], dtype=float),
+            2.0**zoom_level,
+        )
+
     def get_coordinates(self) -> np.ndarray:
         """
         Return geo coordinates of the north-west corner of the tile.
 
         Code from https://wiki.openstreetmap.org/wiki/Slippy_map_tilenames
         """
-        scale: float = 2.0**self.zoom_level
-        lon_deg: float = self.x / scale * 360.0 - 180.0
-        lat_rad: float = np.arctan(np.sinh(np.pi * (1 - 2 * self.y / scale)))
-        lat_deg: np.ndarray = np.degrees(lat_rad)
-        return np.array((lat_deg, lon_deg))
+        return np.array(
+            _get_tile_coordinates(self.x, self.y, self.zoom_level)
+        )
+
+    @staticmethod
+    def get_coordinates_batch(
+        xs: np.ndarray, ys: np.ndarray, zoom_level: int
+    ) -> np.ndarray:
+        """
+        Compute north-west corner coordinates for arrays of tile indices.
+
+        Vectorized version of `get_coordinates`.
+
+        :param xs: array of tile x indices
+        :param ys: array of tile y indices
+        :param zoom_level: zoom level in OpenStreetMap terminology
+        :return: array of geo positions of shape (N, 2) in the form of
+            (latitude, longitude) rows
+        """
+        latitudes, longitudes = _coordinates_from_tile_indices(
+            np.ascontiguousarray(xs, dtype=float),
+            np.ascontiguousarray(ys, dtype=float),
+            2.0**zoom_level,
+        )
+        return np.column_stack((latitudes, longitudes))
 
     def get_boundary_box(self) -> BoundaryBox:
         """
         Get geographical boundary box of the tile: north-west and south-east
         points.
         """
-        point_1: np.ndarray = self.get_coordinates()
-        point_2: np.ndarray = Tile(
+        top, left = _get_tile_coordinates(self.x, self.y, self.zoom_level)
+        bottom, right = _get_tile_coordinates(
             self.x + 1, self.y + 1, self.zoom_level
-        ).get_coordinates()
-
-        return BoundaryBox(point_1[1], point_2[0], point_2[1], point_1[0])
+        )
+        return BoundaryBox(left, bottom, right, top)
 
     def get_extended_boundary_box(self) -> BoundaryBox:
         """Same as get_boundary_box, but with extended boundaries."""
-        point_1: np.ndarray = self.get_coordinates()
-        point_2: np.ndarray = Tile(
-            self.x + 1, self.y + 1, self.zoom_level
-        ).get_coordinates()
-
-        return BoundaryBox(
-            point_1[1], point_2[0], point_2[1], point_1[0]
-        ).round()
+        return self.get_boundary_box().round()
 
     def load_osm_data(self, cache_path: Path) -> OSMData:
         """
@@ -101,15 +339,64 @@ class Tile:
 
         :param cache_path: directory to store OSM data files
         """
+        boundary_box: BoundaryBox = self.get_extended_boundary_box()
         cache_file_path: Path = (
-            cache_path / f"{self.get_extended_boundary_box().get_format()}.osm"
+            cache_path / f"{boundary_box.get_format()}.osm"
         )
-        get_osm(self.get_extended_boundary_box(), cache_file_path)
+        return load_cached_osm_data(boundary_box, cache_file_path)
 
-        osm_data: OSMData = OSMData()
-        osm_data.parse_osm_file(cache_file_path)
+    @classmethod
+    def load_osm_data_for_group(
+        cls, tiles: list["Tile"], cache_path: Path
+    ) -> OSMData:
+        """
+        Construct map data shared by a group of adjacent tiles.
+
+        One OSM extract covering the union of the extended boundary boxes is
+        downloaded and parsed once, instead of one overlapping extract per
+        tile.  The result can be passed to `draw_with_osm_data` of every
+        tile in the group.
+
+        :param tiles: tiles to load data for
+        :param cache_path: directory to store OSM data files
+        """
+        boundary_box: BoundaryBox = tiles[0].get_extended_boundary_box()
+        for tile in tiles[1:]:
+            boundary_box.combine(tile.get_extended_boundary_box())
+
+        cache_file_path: Path = (
+            cache_path / f"{boundary_box.get_format()}.osm"
+        )
+        return load_cached_osm_data(boundary_box, cache_file_path)
+
+    @classmethod
+    def load_osm_data_batch(
+        cls, tiles: list["Tile"], cache_path: Path
+    ) -> list[OSMData]:
+        """
+        Construct map data for several tiles, downloading concurrently.
 
-        return osm_data
+        Downloads for all tiles are issued at once so their network round
+        trips overlap; parsing is still sequential.
+
+        :param tiles: tiles to load data for
+        :param cache_path: directory to store OSM data files
+        """
+        boundary_boxes: list[BoundaryBox] = [
+            tile.get_extended_boundary_box() for tile in tiles
+        ]
+        cache_file_paths: list[Path] = [
+            cache_path / f"{boundary_box.get_format()}.osm"
+            for boundary_box in boundary_boxes
+        ]
+        get_osm_batch(boundary_boxes, cache_file_paths)
+
+        return [
+            load_cached_osm_data(boundary_box, cache_file_path)
+            for boundary_box, cache_file_path in zip(
+                boundary_boxes, cache_file_paths
+            )
+        ]
 
     def get_file_name(self, directory_name: Path) -> Path:
         """Get tile output SVG file path."""
@@ -130,7 +417,7 @@ class Tile:
         self,
         directory_name: Path,
         cache_path: Path,
-        configuration: MapConfiguration,
+        configuration: "MapConfiguration",
     ) -> None:
         """
         Draw tile to SVG and PNG files.
@@ -150,18 +437,17 @@ class Tile:
         self,
         osm_data: OSMData,
         directory_name: Path,
-        configuration: MapConfiguration,
+        configuration: "MapConfiguration",
     ) -> None:
         """Draw SVG and PNG tile using OpenStreetMap data."""
-        top, left = self.get_coordinates()
-        bottom, right = Tile(
-            self.x + 1, self.y + 1, self.zoom_level
-        ).get_coordinates()
+        import cairosvg
+        import svgwrite
 
-        flinger: MercatorFlinger = MercatorFlinger(
-            BoundaryBox(left, bottom, right, top),
-            self.zoom_level,
-            osm_data.equator_length,
+        from map_machine.drawing import write_svg
+        from map_machine.geometry.flinger import MercatorFlinger
+
+        flinger: MercatorFlinger = _get_tile_flinger(
+            self.x, self.y, self.zoom_level, osm_data.equator_length
         )
         size: np.ndarray = flinger.size
 
@@ -170,27 +456,22 @@ class Tile:
         svg: svgwrite.Drawing = svgwrite.Drawing(
             str(output_file_name), size=size
         )
-        icon_extractor: ShapeExtractor = ShapeExtractor(
-            workspace.ICONS_PATH, workspace.ICONS_CONFIG_PATH
-        )
-        constructor: Constructor = Constructor(
-            osm_data, flinger, icon_extractor, configuration
+        constructor, painter = _get_constructor_and_painter(
+            osm_data, flinger, svg, configuration
         )
         constructor.construct()
-
-        painter: Map = Map(
-            flinger=flinger, svg=svg, configuration=configuration
-        )
         painter.draw(constructor)
 
-        with output_file_name.open("w", encoding="utf-8") as output_file:
-            svg.write(output_file)
-        logging.info(f"Tile is drawn to {output_file_name}.")
+        with output_file_name.open(
+            "w", encoding="utf-8", buffering=SVG_WRITE_BUFFER_SIZE
+        ) as output_file:
+            write_svg(svg, output_file)
+        logging.info("Tile is drawn to %s.", output_file_name)
 
         output_path: Path = output_file_name.with_suffix(".png")
         with output_file_name.open(encoding="utf-8") as input_file:
             cairosvg.svg2png(file_obj=input_file, write_to=str(output_path))
-        logging.info(f"SVG file is rasterized to {output_path}.")
+        logging.info("SVG file is rasterized to %s.", output_path)
 
     def subdivide(self, zoom_level: int) -> list["Tile"]:
         """Get subtiles of the tile."""
@@ -228,20 +509,22 @@ class Tiles:
         :param zoom_level: zoom level in OpenStreetMap terminology
         """
         tiles: list[Tile] = []
-        tile_1: Tile = Tile.from_coordinates(
-            boundary_box.get_left_top(), zoom_level
-        )
-        tile_2: Tile = Tile.from_coordinates(
-            boundary_box.get_right_bottom(), zoom_level
+        xs, ys = Tile.from_coordinates_batch(
+            np.array(
+                (boundary_box.get_left_top(), boundary_box.get_right_bottom())
+            ),
+            zoom_level,
         )
+        tile_1: Tile = Tile(int(xs[0]), int(ys[0]), zoom_level)
+        tile_2: Tile = Tile(int(xs[1]), int(ys[1]), zoom_level)
         for x in range(tile_1.x, tile_2.x + 1):
             for y in range(tile_1.y, tile_2.y + 1):
                 tiles.append(Tile(x, y, zoom_level))
 
         latitude_2, longitude_1 = tile_1.get_coordinates()
-        latitude_1, longitude_2 = Tile(
+        latitude_1, longitude_2 = _get_tile_coordinates(
             tile_2.x + 1, tile_2.y + 1, zoom_level
-        ).get_coordinates()
+        )
         assert longitude_2 > longitude_1
         assert latitude_2 > latitude_1
 
@@ -256,15 +539,13 @@ class Tiles:
         cache_file_path: Path = (
             cache_path / f"{self.boundary_box.get_format()}.osm"
         )
-        get_osm(self.boundary_box, cache_file_path)
-
-        osm_data: OSMData = OSMData()
-        osm_data.parse_osm_file(cache_file_path)
-
-        return osm_data
+        return load_cached_osm_data(self.boundary_box, cache_file_path)
 
     def draw_separately(
-        self, directory: Path, cache_path: Path, configuration: MapConfiguration
+        self,
+        directory: Path,
+        cache_path: Path,
+        configuration: "MapConfiguration",
     ) -> None:
         """
         Draw set of tiles as SVG file separately and rasterize them into a set
@@ -274,15 +555,29 @@ class Tiles:
         :param cache_path: directory for temporary OSM files
         :param configuration: drawing configuration
         """
+        import cairosvg
+
         osm_data: OSMData = self.load_osm_data(cache_path)
 
+        to_draw: list[Tile] = [
+            tile
+            for tile in self.tiles
+            if not tile.get_file_name(directory).exists()
+        ]
+        if len(to_draw) > 1:
+            # Tiles are independent of each other, so draw them on all
+            # processor cores.  Shared data is sent to every worker once
+            # through the pool initializer.
+            with ProcessPoolExecutor(
+                initializer=_initialize_tile_worker,
+                initargs=(osm_data, directory, configuration),
+            ) as executor:
+                list(executor.map(_draw_tile, to_draw))
+        elif to_draw:
+            to_draw[0].draw_with_osm_data(osm_data, directory, configuration)
+
         for tile in self.tiles:
             file_path: Path = tile.get_file_name(directory)
-            if not file_path.exists():
-                tile.draw_with_osm_data(osm_data, directory, configuration)
-            else:
-                logging.debug(f"File {file_path} already exists.")
-
             output_path: Path = file_path.with_suffix(".png")
 
             if not output_path.exists():
@@ -290,9 +585,9 @@ class Tiles:
                     cairosvg.svg2png(
                         file_obj=input_file, write_to=str(output_path)
                     )
-                logging.info(f"SVG file is rasterized to {output_path}.")
+                logging.info("SVG file is rasterized to %s.", output_path)
             else:
-                logging.debug(f"File {output_path} already exists.")
+                logging.debug("File %s already exists.", output_path)
 
     def tiles_exist(self, directory_name: Path) -> bool:
         """Check whether all tiles are drawn."""
@@ -302,7 +597,7 @@ class Tiles:
         self,
         directory: Path,
         cache_path: Path,
-        configuration: MapConfiguration,
+        configuration: "MapConfiguration",
         osm_data: OSMData,
         redraw: bool = False,
     ) -> None:
@@ -316,6 +611,8 @@ class Tiles:
         :param osm_data: OpenStreetMap data
         :param redraw: update cache
         """
+        from PIL import Image
+
         if self.tiles_exist(directory) and not redraw:
             return
 
@@ -341,7 +638,7 @@ class Tiles:
                     tile.get_file_name(directory).with_suffix(".png")
                 )
                 logging.info(
-                    f"Tile {tile.zoom_level}/{tile.x}/{tile.y} is created."
+                    "Tile %s/%s/%s is created.", tile.zoom_level, tile.x, tile.y
                 )
 
     def get_file_path(self, cache_path: Path) -> Path:
@@ -352,7 +649,7 @@ class Tiles:
         )
 
     def draw_image(
-        self, cache_path: Path, configuration: MapConfiguration
+        self, cache_path: Path, configuration: "MapConfiguration"
     ) -> None:
         """
         Draw all tiles as one picture.
@@ -366,31 +663,34 @@ class Tiles:
     def draw_image_from_osm_data(
         self,
         cache_path: Path,
-        configuration: MapConfiguration,
+        configuration: "MapConfiguration",
         osm_data: OSMData,
         redraw: bool = False,
     ) -> None:
         """Draw all tiles using OSM data."""
+        import cairosvg
+        import svgwrite
+
+        from map_machine.constructor import Constructor
+        from map_machine.drawing import write_svg
+        from map_machine.geometry.flinger import MercatorFlinger
+        from map_machine.mapper import Map
+
         output_path: Path = self.get_file_path(cache_path)
 
         if not output_path.exists() or redraw:
             top, left = self.tile_1.get_coordinates()
-            bottom, right = Tile(
-                self.tile_2.x + 1,
-                self.tile_2.y + 1,
-                self.zoom_level,
-            ).get_coordinates()
+            bottom, right = _get_tile_coordinates(
+                self.tile_2.x + 1, self.tile_2.y + 1, self.zoom_level
+            )
 
             flinger: MercatorFlinger = MercatorFlinger(
                 BoundaryBox(left, bottom, right, top),
                 self.zoom_level,
                 osm_data.equator_length,
             )
-            extractor: ShapeExtractor = ShapeExtractor(
-                workspace.ICONS_PATH, workspace.ICONS_CONFIG_PATH
-            )
             constructor: Constructor = Constructor(
-                osm_data, flinger, extractor, configuration
+                osm_data, flinger, get_icon_extractor(), configuration
             )
             constructor.construct()
 
@@ -400,20 +700,22 @@ class Tiles:
             map_: Map = Map(flinger, svg, configuration)
             map_.draw(constructor)
 
-            logging.info(f"Writing output SVG {output_path}...")
-            with output_path.open("w+", encoding="utf-8") as output_file:
-                svg.write(output_file)
+            logging.info("Writing output SVG %s...", output_path)
+            with output_path.open(
+                "w+", encoding="utf-8", buffering=SVG_WRITE_BUFFER_SIZE
+            ) as output_file:
+                write_svg(svg, output_file)
         else:
-            logging.debug(f"File {output_path} already exists.")
+            logging.debug("File %s already exists.", output_path)
 
         png_path: Path = self.get_file_path(cache_path).with_suffix(".png")
 
         if not png_path.exists() or redraw:
             with output_path.open(encoding="utf-8") as input_file:
                 cairosvg.svg2png(file_obj=input_file, write_to=str(png_path))
-            logging.info(f"SVG file is rasterized to {png_path}.")
+            logging.info("SVG file is rasterized to %s.", png_path)
         else:
-            logging.debug(f"File {png_path} already exists.")
+            logging.debug("File %s already exists.", png_path)
 
     def subdivide(self, zoom_level: int) -> "Tiles":
         """Get subtiles from tiles."""
@@ -465,6 +767,10 @@ def parse_zoom_level(zoom_level_specification: str) -> list[int]:
 
 def generate_tiles(options: argparse.Namespace) -> None:
     """Simple user interface for tile generation."""
+    from map_machine.map_configuration import MapConfiguration
+    from map_machine.scheme import Scheme
+    from map_machine.workspace import workspace
+
     directory: Path = workspace.get_tile_path()
 
     zoom_levels: list[int] = parse_zoom_level(options.zoom)
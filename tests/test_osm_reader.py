@@ -1,6 +1,11 @@
 """Test OSM XML parsing."""
+from pathlib import Path
+from xml.etree import ElementTree
+
 import numpy as np
+import pytest
 
+from map_machine.osm import osm_reader
 from map_machine.osm.osm_reader import (
     OSMData,
     OSMNode,
@@ -104,6 +109,70 @@ def test_relation() -> None:
     assert relation.members[0].ref == 2
 
 
+def test_parse_file(tmp_path: Path) -> None:
+    """Test streaming OSM file parsing against text parsing."""
+    content: str = """<?xml version="1.0"?>
+<osm>
+  <bounds minlat="10" minlon="5" maxlat="10.001" maxlon="5.001" />
+  <node id="1" lon="5" lat="10" />
+  <node id="2" lon="5.001" lat="10.001">
+    <tag k="key" v="value" />
+  </node>
+  <way id="3">
+    <nd ref="1" />
+    <nd ref="2" />
+    <tag k="key" v="value" />
+  </way>
+  <relation id="4">
+    <member type="way" ref="3" role="outer" />
+  </relation>
+</osm>"""
+    file_path: Path = tmp_path / "test.osm"
+    file_path.write_text(content)
+
+    osm_data: OSMData = OSMData()
+    osm_data.parse_osm_file(file_path)
+
+    expected: OSMData = OSMData()
+    expected.parse_osm_text(content)
+
+    assert osm_data.nodes.keys() == expected.nodes.keys()
+    assert osm_data.ways.keys() == expected.ways.keys()
+    assert osm_data.relations.keys() == expected.relations.keys()
+    assert osm_data.ways[3].tags["key"] == "value"
+    assert [node.id_ for node in osm_data.ways[3].nodes] == [1, 2]
+    assert osm_data.view_box is not None
+    assert np.allclose(osm_data.view_box.min_(), expected.view_box.min_())
+
+
+def test_parse_file_chunked(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test file parsing when the XML spans several parser chunks."""
+    monkeypatch.setattr(osm_reader, "XML_CHUNK_SIZE", 64)
+
+    nodes: str = "".join(
+        f'  <node id="{index}" lon="5" lat="10" />\n'
+        for index in range(1, 101)
+    )
+    file_path: Path = tmp_path / "test.osm"
+    file_path.write_text(f'<?xml version="1.0"?>\n<osm>\n{nodes}</osm>')
+    assert file_path.stat().st_size > 64
+
+    osm_data: OSMData = OSMData()
+    osm_data.parse_osm_file(file_path)
+    assert len(osm_data.nodes) == 100
+
+
+def test_parse_empty_file(tmp_path: Path) -> None:
+    """Test that an empty OSM file fails the same way as empty text."""
+    file_path: Path = tmp_path / "test.osm"
+    file_path.write_text("")
+
+    with pytest.raises(ElementTree.ParseError):
+        OSMData().parse_osm_file(file_path)
+
+
 def test_parse_levels() -> None:
     """Test level parsing."""
     assert parse_levels("1") == [1]
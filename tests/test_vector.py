@@ -1,7 +1,13 @@
 """Test vector operations."""
 import numpy as np
 
-from map_machine.geometry.vector import compute_angle, turn_by_angle
+from map_machine.geometry.vector import (
+    compute_angle,
+    compute_pseudo_angle,
+    perp_ccw,
+    perp_cw,
+    turn_by_angle,
+)
 
 __author__ = "Sergey Vartanov"
 __email__ = "me@enzet.ru"
@@ -21,8 +27,34 @@ def test_compute_angle() -> None:
     assert np.allclose(compute_angle(np.array((ROOT, -ROOT))), np.pi * 1.75)
 
 
+def test_compute_pseudo_angle() -> None:
+    """Test that pseudo-angle orders vectors the same way as angle."""
+    vectors: list[np.ndarray] = [
+        np.array((1, 0)),
+        np.array((ROOT, ROOT)),
+        np.array((0, 1)),
+        np.array((-ROOT, ROOT)),
+        np.array((-1, 0)),
+        np.array((-ROOT, -ROOT)),
+        np.array((0, -1)),
+        np.array((ROOT, -ROOT)),
+    ]
+    pseudo_angles: list[float] = [
+        compute_pseudo_angle(vector) for vector in vectors
+    ]
+    assert pseudo_angles == sorted(pseudo_angles)
+    assert all(0 <= angle < 4 for angle in pseudo_angles)
+
+
 def test_turn_by_compute_angle() -> None:
     """Test turing one angle by another."""
     assert np.allclose(
         turn_by_angle(np.array((1, 0)), np.pi / 2), np.array((0, 1))
     )
+
+
+def test_perp() -> None:
+    """Test that perpendicular swaps match 90 degree turns."""
+    vector: np.ndarray = np.array((3, 4))
+    assert np.allclose(perp_ccw(vector), turn_by_angle(vector, np.pi / 2))
+    assert np.allclose(perp_cw(vector), turn_by_angle(vector, -np.pi / 2))